@@ -7,71 +7,281 @@ Combines multiple AXIS bank statement CSV files into a single CSV output
 import pandas as pd
 import os
 import re
+import csv
+import sys
 import shutil
 import argparse
 from datetime import datetime
+from itertools import islice
+from bisect import bisect_right
 import numpy as np
 from pathlib import Path
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-class AXISStatementProcessor:
+# Transaction table columns, in the order they appear after the 'S.No' header row
+AXIS_STATEMENT_COLUMNS = [
+    'serial_no', 'transaction_date', 'value_date', 'particulars', 'debit_amount',
+    'credit_amount', 'balance', 'cheque_number', 'branch_name'
+]
+
+# extract_account_info never reads past this many lines; AXIS headers fit in ~20
+_HEADER_SCAN_LINES = 50
+
+# Header patterns used by extract_account_info
+_ACCT_RE = re.compile(r'Statement of Account No - (\d+)')
+_PERIOD_RE = re.compile(r'for the period \(From : (\d{2}/\d{2}/\d{4}) To : (\d{2}/\d{2}/\d{4})\)')
+_IFSC_RE = re.compile(r'IFSC Code :- (\w+)')
+_MICR_RE = re.compile(r'MICR Code :- (\d+)')
+
+# Start/end dates in the "01/08/2025 to 03/08/2025" period string built from the header
+_PERIOD_DATES_RE = re.compile(r'(\d{2}/\d{2}/\d{4})\s+to\s+(\d{2}/\d{2}/\d{4})')
+
+# Particulars of the non-transaction rows inside the statement table
+_SUMMARY_ROW_RE = re.compile(r'TRANSACTION TOTAL|CLOSING BALANCE|OPENING BALANCE')
+
+# Common reference number patterns in AXIS narrations, tried in order
+_REF_PATTERNS = [re.compile(p) for p in (
+    r'NEFT/([A-Z0-9]+)',  # NEFT reference
+    r'IMPS/([A-Z0-9]+)',  # IMPS reference
+    r'UPI/([A-Z0-9]+)',   # UPI reference
+    r'CLG/(\d+)',         # Cheque clearing
+    r'BRN-CLG-CHQ/(\d+)', # Branch cheque clearing
+    r'AXOIC(\d+)',        # AXIS internal reference
+)]
+
+# What verify_balance_integrity needs from each source file, gathered in one read
+StatementScan = namedtuple('StatementScan', ['opening_balance', 'closing_balance', 'transaction_count'])
+
+def _clean_balance(balance_str):
+    """Clean balance strings (handle negative format with commas)"""
+    # None/NaN are empty; numbers need no string handling
+    if balance_str is None:
+        return 0.0
+    if isinstance(balance_str, float):
+        return 0.0 if balance_str != balance_str else balance_str
+        
+    try:
+        # Remove quotes and commas; this also turns the AXIS format
+        # "-,93,43,827.31" into "-9343827.31"
+        return float(str(balance_str).strip().strip('"').strip("'").replace(',', ''))
+    except ValueError:
+        return 0.0
+
+def _extract_account_info(file_path):
+    """Extract account information from header rows"""
+    account_info = {
+        'account_number': None,
+        'customer_name': None,
+        'branch': None,
+        'statement_period': None,
+        'ifsc_code': None,
+        'micr_code': None
+    }
     
-    def __init__(self, statements_directory):
-        self.statements_dir = statements_directory
-        self.consolidated_data = []
-        self.data_dir = Path(statements_directory).parent
-        
-    def extract_account_info(self, file_path):
-        """Extract account information from header rows"""
-        account_info = {
-            'account_number': None,
-            'customer_name': None,
-            'branch': None,
-            'statement_period': None,
-            'ifsc_code': None,
-            'micr_code': None
-        }
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+    try:
+        # Single pass over the header: every field is picked up as its line goes by,
+        # and reading stops at the transaction table's 'S.No' row or once all are found
+        # (bounded either way, in case a file has no transaction table)
+        account_line_seen = False
+        period_line_seen = False
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(islice(f, _HEADER_SCAN_LINES)):
+                if 'S.No' in line and 'Transaction Date' in line:
+                    break
                 
-            # Extract customer name (line 1)
-            if len(lines) > 0:
-                name_line = lines[0].strip()
-                if name_line.startswith('Name :-'):
-                    account_info['customer_name'] = name_line.replace('Name :-', '').strip().rstrip('.')
-            
-            # Extract account number from statement line (around line 15)
-            for line in lines:
+                # Extract customer name (line 1)
+                if line_number == 0:
+                    name_line = line.strip()
+                    if name_line.startswith('Name :-'):
+                        account_info['customer_name'] = name_line.replace('Name :-', '').strip().rstrip('.')
+                
+                # Extract account number and statement period from the statement line (around line 15)
                 if 'Statement of Account No -' in line:
-                    match = re.search(r'Statement of Account No - (\d+)', line)
-                    if match:
-                        account_info['account_number'] = match.group(1)
-                    break
-            
-            # Extract statement period
-            for line in lines:
-                if 'Statement of Account No -' in line and 'for the period' in line:
-                    match = re.search(r'for the period \(From : (\d{2}/\d{2}/\d{4}) To : (\d{2}/\d{2}/\d{4})\)', line)
-                    if match:
-                        account_info['statement_period'] = f"{match.group(1)} to {match.group(2)}"
-                    break
-            
-            # Extract IFSC and MICR codes
-            for line in lines:
+                    if not account_line_seen:
+                        account_line_seen = True
+                        match = _ACCT_RE.search(line)
+                        if match:
+                            account_info['account_number'] = match.group(1)
+                    if not period_line_seen and 'for the period' in line:
+                        period_line_seen = True
+                        match = _PERIOD_RE.search(line)
+                        if match:
+                            account_info['statement_period'] = f"{match.group(1)} to {match.group(2)}"
+                
+                # Extract IFSC and MICR codes
                 if 'IFSC Code :-' in line:
-                    match = re.search(r'IFSC Code :- (\w+)', line)
+                    match = _IFSC_RE.search(line)
                     if match:
                         account_info['ifsc_code'] = match.group(1)
                 elif 'MICR Code :-' in line:
-                    match = re.search(r'MICR Code :- (\d+)', line)
+                    match = _MICR_RE.search(line)
                     if match:
                         account_info['micr_code'] = match.group(1)
-                        
-        except Exception as e:
-            print(f"Error extracting account info from {file_path}: {str(e)}")
+                
+                if account_line_seen and period_line_seen and account_info['ifsc_code'] and account_info['micr_code']:
+                    break
+                    
+    except Exception as e:
+        print(f"Error extracting account info from {file_path}: {str(e)}")
+        
+    return account_info
+
+def _clean_dates(date_series):
+    """Vectorized clean_date: DD/MM/YYYY strings to datetime64, NaT where unparseable"""
+    # Statements repeat the same few dates many times; cache=True parses each distinct string once
+    return pd.to_datetime(date_series.str.strip(), format='%d/%m/%Y', errors='coerce', cache=True)
+
+def _clean_amounts(amount_series):
+    """Vectorized clean_amount: strip commas/tabs and convert to float (0.0 when empty)"""
+    cleaned = amount_series.str.replace(',', '', regex=False).str.replace('\t', '', regex=False).str.strip()
+    return pd.to_numeric(cleaned, errors='coerce').fillna(0.0)
+
+def _clean_balances(balance_series):
+    """Vectorized clean_balance: handles quoted values and the AXIS "-,93,43,827.31" format"""
+    cleaned = balance_series.str.strip().str.strip('"\'').str.replace(',', '', regex=False)
+    return pd.to_numeric(cleaned, errors='coerce').fillna(0.0)
+
+def parse_statement_file(file_path):
+    """Parse a single AXIS statement file into a transactions DataFrame"""
+    print(f"Processing: {os.path.basename(file_path)}")
+    
+    try:
+        # Extract account information
+        account_info = _extract_account_info(file_path)
+        
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            # Find the header row (contains column names), stopping at the first match
+            header_row = None
+            for i, line in enumerate(f):
+                if 'S.No' in line and 'Transaction Date' in line:
+                    header_row = i
+                    break
+            
+            if header_row is None:
+                print(f"  Could not find header row in {file_path}")
+                return pd.DataFrame()
             
-        return account_info
+            # Hand the rest of the file to the C-implemented csv reader, which handles
+            # quoted fields, embedded commas and embedded newlines in one pass. Rows with
+            # fewer than 9 fields (footer lines) are dropped, as count_transactions_in_file
+            # drops them, so parsed and counted transactions agree; read_csv would pad
+            # them with '' and keep any whose first field parses as a date.
+            column_count = len(AXIS_STATEMENT_COLUMNS)
+            records = [fields[:column_count] for fields in csv.reader(f, skipinitialspace=True)
+                       if len(fields) >= column_count]
+            rows = pd.DataFrame(records, columns=AXIS_STATEMENT_COLUMNS, dtype=str)
+        
+        # Clean the date and amount columns in one vectorized pass each
+        # AXIS CSV format: Debit Amount and Credit Amount are in separate columns
+        rows['date'] = _clean_dates(rows['transaction_date'])
+        rows['value_date'] = _clean_dates(rows['value_date'])
+        rows['debit_amount'] = _clean_amounts(rows['debit_amount'])
+        rows['credit_amount'] = _clean_amounts(rows['credit_amount'])
+        rows['balance'] = _clean_balances(rows['balance'])
+        
+        # Determine transaction type and amounts based on which column has a value
+        is_debit = rows['debit_amount'].to_numpy() > 0
+        is_credit = ~is_debit & (rows['credit_amount'].to_numpy() > 0)
+        rows['withdrawal_amount'] = np.where(is_debit, rows['debit_amount'].to_numpy(), 0.0)
+        rows['deposit_amount'] = np.where(is_credit, rows['credit_amount'].to_numpy(), 0.0)
+        rows['amount'] = rows['withdrawal_amount'] + rows['deposit_amount']
+        rows['transaction_type'] = np.select([is_debit, is_credit], ['Expense', 'Income'], 'Unknown').astype(object)
+        rows['debit_credit'] = np.select([is_debit, is_credit], ['DR', 'CR'], '').astype(object)
+        
+        # Skip summary rows, the opening balance row and rows without a valid date
+        is_summary = rows['particulars'].str.contains(_SUMMARY_ROW_RE)
+        # (rows whose date did not parse as DD/MM/YYYY are dropped)
+        has_date = rows['date'].notna()
+        rows = rows[~is_summary & has_date]
+        cheque_numbers = rows['cheque_number'].str.strip()
+        
+        transactions = pd.DataFrame({
+            'account_number': account_info['account_number'],
+            'customer_name': account_info['customer_name'],
+            'date': rows['date'],
+            'value_date': rows['value_date'],
+            'narration': rows['particulars'].str.strip(),
+            'balance': rows['balance'],
+            'cheque_number': cheque_numbers,
+            'branch_name': rows['branch_name'].str.strip(),
+            'source_file': os.path.basename(file_path),
+            'withdrawal_amount': rows['withdrawal_amount'],
+            'deposit_amount': rows['deposit_amount'],
+            'transaction_type': rows['transaction_type'],
+            'debit_credit': rows['debit_credit'],
+            'amount': rows['amount'],
+            # Use cheque number as reference number if available, otherwise null
+            'reference_number': cheque_numbers
+        }).reset_index(drop=True)
+        
+        print(f"  Extracted {len(transactions)} transactions")
+        return transactions
+        
+    except Exception as e:
+        print(f"Error processing {file_path}: {str(e)}")
+        return pd.DataFrame()
+
+def scan_statement_file(file_path):
+    """Read a statement once for its opening balance, closing balance and transaction count"""
+    opening_balance = None
+    closing_balance = None
+    transaction_count = 0
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            in_transactions = False
+            for fields in csv.reader(f, skipinitialspace=True):
+                # The first usable OPENING/CLOSING BALANCE rows anywhere in the file
+                # (Balance is in field 7, index 6)
+                if len(fields) >= 7:
+                    if opening_balance is None and any('OPENING BALANCE' in field for field in fields):
+                        opening_balance = _clean_balance(fields[6].strip())
+                    if closing_balance is None and any('CLOSING BALANCE' in field for field in fields):
+                        closing_balance = _clean_balance(fields[6].strip())
+                
+                # Transaction rows follow the 'S.No' header row
+                if not in_transactions:
+                    row_text = ','.join(fields)
+                    in_transactions = 'S.No' in row_text and 'Transaction Date' in row_text
+                    continue
+                
+                # Skip short rows and summary rows; count rows with a date
+                if len(fields) < 9 or _SUMMARY_ROW_RE.search(fields[3]):
+                    continue
+                if len(fields[1].strip()) >= 5:
+                    transaction_count += 1
+    except Exception as e:
+        print(f"Error scanning {file_path}: {str(e)}")
+    
+    return StatementScan(opening_balance, closing_balance, transaction_count)
+
+class AXISStatementProcessor:
+    
+    def __init__(self, statements_directory, parallel=False):
+        self.statements_dir = statements_directory
+        # Parse statements on a process pool; worth it for a CLI run over many files,
+        # but callers inside a web request keep the default serial parse
+        self.parallel = parallel
+        self.consolidated_data = []
+        self.data_dir = Path(statements_directory).parent
+        # Parsed statement frames keyed by _file_cache_key, so analysis and consolidation
+        # share a single parse of each file
+        self._parse_cache = {}
+        # Balance/count scans of each statement file, keyed the same way
+        self._scan_cache = {}
+        # File analyses keyed by the cache keys of the files analyzed, so the
+        # verification pass reuses the analysis done for consolidation
+        self._analysis_cache = {}
+        # Scan the statements directory once; every stage of the run reuses this list
+        with os.scandir(statements_directory) as entries:
+            self._csv_files = sorted(
+                (entry for entry in entries if entry.is_file() and entry.name.lower().endswith('.csv')),
+                key=lambda entry: entry.name
+            )
+        
+    def extract_account_info(self, file_path):
+        """Extract account information from header rows"""
+        return _extract_account_info(file_path)
     
     def clean_date(self, date_str):
         """Convert DD/MM/YYYY format to YYYY-MM-DD"""
@@ -90,155 +300,49 @@ class AXISStatementProcessor:
     
     def clean_amount(self, amount_str):
         """Clean and convert amount strings to float"""
-        if pd.isna(amount_str) or amount_str == '' or str(amount_str).strip() == '':
+        # None/NaN are empty; numbers need no string handling
+        if amount_str is None:
             return 0.0
+        if isinstance(amount_str, float):
+            return 0.0 if amount_str != amount_str else amount_str
             
         try:
-            # Remove commas, tabs, and convert to float
-            amount_str = str(amount_str).replace(',', '').replace('\t', '').strip()
-            return float(amount_str)
-        except:
+            # Remove commas and tabs; float() ignores surrounding whitespace and
+            # rejects empty strings
+            return float(str(amount_str).replace(',', '').replace('\t', ''))
+        except ValueError:
             return 0.0
     
     def clean_balance(self, balance_str):
         """Clean balance strings (handle negative format with commas)"""
-        if pd.isna(balance_str) or balance_str == '' or str(balance_str).strip() == '':
-            return 0.0
-            
-        try:
-            balance_str = str(balance_str).strip()
-            # Remove quotes if present
-            balance_str = balance_str.strip('"').strip("'")
-            # Remove commas and handle negative format
-            balance_str = balance_str.replace(',', '')
-            # Handle AXIS format like "-,93,43,827.31"
-            if balance_str.startswith('-,'):
-                balance_str = '-' + balance_str[2:]
-            return float(balance_str)
-        except:
-            return 0.0
+        return _clean_balance(balance_str)
     
-    def process_single_file(self, file_path):
-        """Process a single AXIS statement file"""
-        print(f"Processing: {os.path.basename(file_path)}")
-        
+    def clean_dates(self, date_series):
+        """Vectorized clean_date: DD/MM/YYYY strings to datetime64, NaT where unparseable"""
+        return _clean_dates(date_series)
+    
+    def clean_amounts(self, amount_series):
+        """Vectorized clean_amount: strip commas/tabs and convert to float (0.0 when empty)"""
+        return _clean_amounts(amount_series)
+    
+    def clean_balances(self, balance_series):
+        """Vectorized clean_balance: handles quoted values and the AXIS "-,93,43,827.31" format"""
+        return _clean_balances(balance_series)
+    
+    def _file_cache_key(self, file_path):
+        """Cache key for a statement file; changes whenever the file is rewritten"""
         try:
-            # Read the file as text first to handle embedded newlines
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Extract account information
-            account_info = self.extract_account_info(file_path)
-            
-            # Find the header row (contains column names)
-            header_row = None
-            for i, line in enumerate(lines):
-                if 'S.No' in line and 'Transaction Date' in line:
-                    header_row = i
-                    break
-            
-            if header_row is None:
-                print(f"  Could not find header row in {file_path}")
-                return []
-            
-            # Parse the CSV manually starting from header row
-            transactions = []
-            header_line = lines[header_row].strip()
-            columns = header_line.split(',')
-            
-            # Process each line after the header
-            for i in range(header_row + 1, len(lines)):
-                line = lines[i].strip()
-                if not line:
-                    continue
-                
-                # Split by comma, but handle quoted fields properly
-                fields = self.parse_csv_line(line)
-                if len(fields) < 9:  # Need at least 9 columns
-                    continue
-                
-                # Skip summary rows
-                if 'TRANSACTION TOTAL' in fields[3] or 'CLOSING BALANCE' in fields[3]:
-                    continue
-                
-                # Skip opening balance row
-                if 'OPENING BALANCE' in fields[3]:
-                    continue
-                
-                # Check if this is a valid transaction row
-                date_str = fields[1].strip()  # Transaction Date
-                if not date_str or date_str == '' or len(date_str) < 5:
-                    continue
-                
-                # Clean the transaction data
-                # AXIS CSV format: Debit Amount and Credit Amount are in separate columns
-                debit_amount = self.clean_amount(fields[4])  # Debit Amount(INR)
-                credit_amount = self.clean_amount(fields[5])  # Credit Amount(INR)
-                
-                transaction = {
-                    'account_number': account_info['account_number'],
-                    'customer_name': account_info['customer_name'],
-                    'date': self.clean_date(fields[1]),  # Transaction Date
-                    'value_date': self.clean_date(fields[2]),  # Value Date
-                    'narration': fields[3].strip() if len(fields) > 3 else '',  # Particulars
-                    'balance': self.clean_balance(fields[6]),  # Balance(INR)
-                    'cheque_number': fields[7].strip() if len(fields) > 7 else '',  # Cheque Number
-                    'branch_name': fields[8].strip() if len(fields) > 8 else '',  # Branch Name
-                    'source_file': os.path.basename(file_path)
-                }
-                
-                # Determine transaction type and amounts based on which column has a value
-                if debit_amount > 0:
-                    transaction['withdrawal_amount'] = debit_amount
-                    transaction['deposit_amount'] = 0.0
-                    transaction['transaction_type'] = 'Expense'
-                    transaction['debit_credit'] = 'DR'
-                    transaction['amount'] = debit_amount
-                elif credit_amount > 0:
-                    transaction['withdrawal_amount'] = 0.0
-                    transaction['deposit_amount'] = credit_amount
-                    transaction['transaction_type'] = 'Income'
-                    transaction['debit_credit'] = 'CR'
-                    transaction['amount'] = credit_amount
-                else:
-                    transaction['withdrawal_amount'] = 0.0
-                    transaction['deposit_amount'] = 0.0
-                    transaction['transaction_type'] = 'Unknown'
-                    transaction['debit_credit'] = ''
-                    transaction['amount'] = 0.0
-                
-                # Use cheque number as reference number if available, otherwise null
-                transaction['reference_number'] = transaction['cheque_number'] if transaction['cheque_number'] else ''
-                
-                # Only add if we have a valid date
-                if transaction['date']:
-                    transactions.append(transaction)
-            
-            print(f"  Extracted {len(transactions)} transactions")
-            return transactions
-            
-        except Exception as e:
-            print(f"Error processing {file_path}: {str(e)}")
-            return []
+            stat = os.stat(file_path)
+            return (os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return (os.path.realpath(file_path), None, None)
     
-    def parse_csv_line(self, line):
-        """Parse a CSV line, handling quoted fields and embedded commas"""
-        fields = []
-        current_field = ""
-        in_quotes = False
-        
-        for char in line:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == ',' and not in_quotes:
-                fields.append(current_field.strip())
-                current_field = ""
-            else:
-                current_field += char
-        
-        # Add the last field
-        fields.append(current_field.strip())
-        return fields
+    def process_single_file(self, file_path):
+        """Process a single AXIS statement file, reusing the parse from earlier in this run"""
+        cache_key = self._file_cache_key(file_path)
+        if cache_key not in self._parse_cache:
+            self._parse_cache[cache_key] = parse_statement_file(file_path)
+        return self._parse_cache[cache_key]
     
     def extract_reference_number(self, narration):
         """Extract reference number from transaction narration"""
@@ -246,17 +350,8 @@ class AXISStatementProcessor:
             return ''
         
         # Look for common reference number patterns in AXIS statements
-        patterns = [
-            r'NEFT/([A-Z0-9]+)',  # NEFT reference
-            r'IMPS/([A-Z0-9]+)',  # IMPS reference
-            r'UPI/([A-Z0-9]+)',   # UPI reference
-            r'CLG/(\d+)',         # Cheque clearing
-            r'BRN-CLG-CHQ/(\d+)', # Branch cheque clearing
-            r'AXOIC(\d+)',        # AXIS internal reference
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, narration)
+        for pattern in _REF_PATTERNS:
+            match = pattern.search(narration)
             if match:
                 return match.group(1)
         
@@ -265,8 +360,7 @@ class AXISStatementProcessor:
     
     def process_all_files(self):
         """Process all CSV files in the statements directory with intelligent deduplication"""
-        csv_files = [f for f in os.listdir(self.statements_dir) 
-                    if f.endswith('.CSV') or f.endswith('.csv')]
+        csv_files = [entry.name for entry in self._csv_files]
         
         print(f"Found {len(csv_files)} CSV files to process")
         
@@ -281,16 +375,25 @@ class AXISStatementProcessor:
             print(f"  {file_info['filename']}: {file_info['start_date']} to {file_info['end_date']} ({file_info['duration_days']} days, {file_info['transaction_count']} transactions)")
         
         # Process files in priority order with deduplication
-        all_transactions = self.process_files_with_deduplication(prioritized_files)
-        
-        return all_transactions
+        return self.process_files_with_deduplication(prioritized_files)
     
     def analyze_statement_files(self, csv_files):
         """Analyze all statement files to understand their periods and coverage"""
+        file_paths = [os.path.join(self.statements_dir, file) for file in csv_files]
+        
+        # Reuse an earlier analysis of the same, unchanged files (verification
+        # re-analyzes the set consolidation just did)
+        analysis_key = tuple(self._file_cache_key(file_path) for file_path in file_paths)
+        if analysis_key in self._analysis_cache:
+            return list(self._analysis_cache[analysis_key])
+        
         file_analysis = []
         
-        for file in csv_files:
-            file_path = os.path.join(self.statements_dir, file)
+        # Parse every file once up front (in parallel for CLI runs); the per-file lookups below
+        # and the deduplication pass then reuse the cached frames
+        self.process_files_in_parallel(file_paths)
+        
+        for file, file_path in zip(csv_files, file_paths):
             try:
                 # Extract account info and period
                 account_info = self.extract_account_info(file_path)
@@ -303,7 +406,7 @@ class AXISStatementProcessor:
                 end_date = None
                 if account_info['statement_period']:
                     # Extract dates from period string like "01/08/2025 to 03/08/2025"
-                    period_match = re.search(r'(\d{2}/\d{2}/\d{4})\s+to\s+(\d{2}/\d{2}/\d{4})', account_info['statement_period'])
+                    period_match = _PERIOD_DATES_RE.search(account_info['statement_period'])
                     if period_match:
                         start_date = self.clean_date(period_match.group(1))
                         end_date = self.clean_date(period_match.group(2))
@@ -311,7 +414,6 @@ class AXISStatementProcessor:
                 # Calculate duration
                 duration_days = 0
                 if start_date and end_date:
-                    from datetime import datetime
                     start_dt = datetime.strptime(start_date, '%Y-%m-%d')
                     end_dt = datetime.strptime(end_date, '%Y-%m-%d')
                     duration_days = (end_dt - start_dt).days + 1
@@ -331,7 +433,8 @@ class AXISStatementProcessor:
                 print(f"Error analyzing {file}: {str(e)}")
                 continue
         
-        return file_analysis
+        self._analysis_cache[analysis_key] = file_analysis
+        return list(file_analysis)
     
     def prioritize_files_by_coverage(self, file_analysis):
         """Prioritize files by coverage - most comprehensive first"""
@@ -341,55 +444,68 @@ class AXISStatementProcessor:
                            reverse=True)
         return prioritized
     
+    def process_files_in_parallel(self, file_paths):
+        """Parse statement files (across worker processes when enabled), returning results in input order"""
+        # Only files not already in the parse cache go to the pool
+        pending = [file_path for file_path in dict.fromkeys(file_paths)
+                   if self._file_cache_key(file_path) not in self._parse_cache]
+        
+        if self.parallel and len(pending) > 1:
+            max_workers = min(len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for file_path, parsed in zip(pending, executor.map(parse_statement_file, pending)):
+                    self._parse_cache[self._file_cache_key(file_path)] = parsed
+        
+        return [self.process_single_file(file_path) for file_path in file_paths]
+    
     def process_files_with_deduplication(self, prioritized_files):
         """Process files in priority order with intelligent deduplication"""
-        all_transactions = []
-        processed_transaction_keys = set()  # Track unique transaction identifiers
-        
         print(f"\n🔄 Processing files with deduplication:")
         
-        for file_info in prioritized_files:
-            file_path = file_info['file_path']
+        # Files are independent, so parse them all up front
+        parsed_files = self.process_files_in_parallel([file_info['file_path'] for file_info in prioritized_files])
+        
+        # Concatenate once in priority order; a transaction is a duplicate when its key
+        # already appeared earlier (in a higher-priority file or earlier in the same one)
+        frames = [file_transactions for file_transactions in parsed_files if not file_transactions.empty]
+        if not frames:
+            print(f"\n✅ Total unique transactions after deduplication: 0")
+            return pd.DataFrame()
+        
+        all_transactions = pd.concat(frames, ignore_index=True)
+        is_duplicate = self.create_transaction_keys(all_transactions).duplicated().to_numpy()
+        
+        offset = 0
+        for file_info, file_transactions in zip(prioritized_files, parsed_files):
             filename = file_info['filename']
             
             print(f"\nProcessing: {filename}")
             print(f"  Period: {file_info['start_date']} to {file_info['end_date']} ({file_info['duration_days']} days)")
             
-            # Get all transactions from this file
-            file_transactions = self.process_single_file(file_path)
+            # Report this file's share of the duplicates
+            file_duplicates = is_duplicate[offset:offset + len(file_transactions)]
+            offset += len(file_transactions)
+            for transaction in file_transactions[file_duplicates].itertuples(index=False):
+                print(f"    Skipping duplicate transaction: {transaction.date:%Y-%m-%d} - {transaction.narration[:50]}...")
             
-            # Filter out duplicate transactions
-            new_transactions = []
-            skipped_count = 0
-            
-            for transaction in file_transactions:
-                # Create a unique key for this transaction
-                transaction_key = self.create_transaction_key(transaction)
-                
-                if transaction_key not in processed_transaction_keys:
-                    new_transactions.append(transaction)
-                    processed_transaction_keys.add(transaction_key)
-                else:
-                    skipped_count += 1
-                    print(f"    Skipping duplicate transaction: {transaction['date']} - {transaction['narration'][:50]}...")
-            
-            print(f"  Added {len(new_transactions)} new transactions (skipped {skipped_count} duplicates)")
-            all_transactions.extend(new_transactions)
+            skipped_count = int(file_duplicates.sum())
+            print(f"  Added {len(file_transactions) - skipped_count} new transactions (skipped {skipped_count} duplicates)")
+        
+        all_transactions = all_transactions[~is_duplicate].reset_index(drop=True)
         
         print(f"\n✅ Total unique transactions after deduplication: {len(all_transactions)}")
         return all_transactions
     
-    def create_transaction_key(self, transaction):
-        """Create a unique key for a transaction to identify duplicates"""
-        # Combine multiple fields to create a unique identifier
-        key_parts = [
-            transaction['date'],
-            transaction['narration'][:100],  # First 100 chars of narration
-            str(transaction['amount']),
-            transaction['debit_credit'],
-            transaction['cheque_number'] if transaction['cheque_number'] else ''
-        ]
-        return '|'.join(key_parts)
+    def create_transaction_keys(self, transactions):
+        """Build the per-row key columns used to identify duplicate transactions"""
+        # Two rows are the same transaction when all of these fields match
+        return pd.DataFrame({
+            'date': transactions['date'],
+            'narration': transactions['narration'].str[:100],  # First 100 chars of narration
+            'amount': transactions['amount'],
+            'debit_credit': transactions['debit_credit'],
+            'cheque_number': transactions['cheque_number'].fillna('')
+        })
     
     def create_consolidated_csv(self, output_file='consolidated_axis_statements.csv'):
         """Create consolidated CSV from all bank statements"""
@@ -401,15 +517,12 @@ class AXISStatementProcessor:
         self.create_output_directories()
         
         # Process all files
-        all_transactions = self.process_all_files()
+        df = self.process_all_files()
         
-        if not all_transactions:
+        if df.empty:
             print("No transactions found to consolidate!")
             return
         
-        # Create DataFrame
-        df = pd.DataFrame(all_transactions)
-        
         # Sort by date and account number
         df = df.sort_values(['account_number', 'date'], na_position='last')
         
@@ -427,94 +540,99 @@ class AXISStatementProcessor:
         
         df['account_name'] = df['account_number'].map(account_mapping).fillna('Unknown')
         
-        # Detect inter-bank transactions vs unique transactions
-        # Group by reference_number and calculate stats
-        ref_stats = df.groupby('reference_number').agg({
-            'net_transaction': ['sum', 'count'],
-            'account_number': 'nunique'
-        }).reset_index()
-        ref_stats.columns = ['reference_number', 'net_sum', 'count', 'unique_accounts']
+        # Low-cardinality text columns are stored as categories before any grouping, so
+        # the groupbys below and in the summary hash integer codes and memory drops;
+        # amounts stay float64 so paise survive
+        for col in ['account_name', 'account_number', 'transaction_type', 'debit_credit']:
+            df[col] = df[col].astype('category')
         
-        # Merge back to main dataframe
-        df = df.merge(ref_stats, on='reference_number', how='left')
+        # Detect inter-bank transactions vs unique transactions
+        # Group by reference_number and broadcast the stats back onto each row as
+        # plain arrays (transform keeps row alignment, so nothing is joined onto
+        # df and there are no helper columns to drop afterwards)
+        ref_grouped = df.groupby('reference_number', sort=False)
+        net_sums = ref_grouped['net_transaction'].transform('sum').to_numpy()
+        group_sizes = ref_grouped['net_transaction'].transform('count').to_numpy()
+        unique_accounts = ref_grouped['account_number'].transform('nunique').to_numpy()
         
         # Helper function to find reversal groups within a set of transactions
-        def find_reversal_groups(transactions):
+        def find_reversal_groups(amounts):
             """
             Efficiently find subsets of transactions that sum to approximately 0.
+            Takes the group's net_transaction values as a NumPy array.
             Returns indices of transactions that form reversal groups.
             """
-            amounts = transactions['net_transaction'].values
-            indices = list(range(len(amounts)))
-            
             if len(amounts) <= 1:
                 return []
             
-            # For 2 transactions, check if they approximately cancel out
-            if len(amounts) == 2:
-                if abs(amounts[0] + amounts[1]) < 0.01:
-                    return [0, 1]
-                return []
+            # Work in whole paise so "cancels out within 0.01" becomes an exact
+            # complement lookup in a value -> sorted positions index
+            paise = np.rint(np.asarray(amounts) * 100).astype(np.int64).tolist()
+            positions_by_value = {}
+            for position, value in enumerate(paise):
+                positions_by_value.setdefault(value, []).append(position)
             
-            # For larger sets, use efficient approach
-            from itertools import combinations
-            tolerance = 0.01
+            def first_complement_after(target, position):
+                """Smallest index after position holding target, or None"""
+                candidates = positions_by_value.get(target)
+                if candidates:
+                    k = bisect_right(candidates, position)
+                    if k < len(candidates):
+                        return candidates[k]
+                return None
             
-            # Check pairs first (most common case)
-            for i in range(len(amounts)):
-                for j in range(i + 1, len(amounts)):
-                    if abs(amounts[i] + amounts[j]) < tolerance:
-                        return [i, j]
+            # Check pairs first (most common case); scanning i in order and taking the first
+            # complement after i yields the lexicographically-first (i, j) pair
+            for i, value in enumerate(paise):
+                j = first_complement_after(-value, i)
+                if j is not None:
+                    return [i, j]
             
             # Check triplets (second most common)
             if len(amounts) <= 10:
-                for combo in combinations(indices, 3):
-                    combo_sum = sum(amounts[i] for i in combo)
-                    if abs(combo_sum) < tolerance:
-                        return list(combo)
+                for i in range(len(paise)):
+                    for j in range(i + 1, len(paise)):
+                        k = first_complement_after(-(paise[i] + paise[j]), j)
+                        if k is not None:
+                            return [i, j, k]
             
             return []
         
-        # Add helper columns to track reversal classification
-        df['temp_classification'] = 'Unique'
-        df['temp_reversal_group'] = False
+        # Track classifications in a preallocated array and attach it as a column at the end
+        net_amounts = df['net_transaction'].to_numpy()
+        classification = np.full(len(df), 'Unique', dtype=object)
+        
+        nets_to_zero = np.abs(net_sums) < 0.01
+        same_account = unique_accounts <= 1
+        
+        # Multiple accounts - references that net to zero are inter-bank transfers
+        classification[~same_account & nets_to_zero] = 'Inter-bank'
         
-        # Process each reference number separately
-        unique_refs = df['reference_number'].unique()
-        total_refs = len(unique_refs)
-        print(f"🔄 Processing {total_refs} unique reference numbers for reversal detection...")
+        # Same account, two transactions - a reversal exactly when the pair nets to zero,
+        # so these are classified in one vectorized step
+        classification[same_account & (group_sizes == 2) & nets_to_zero] = 'Reversed'
         
-        for idx, ref_num in enumerate(unique_refs):
+        # Same account, three or more transactions - search each reference group for reversals.
+        # Single transactions are always Unique, so they never enter the loop.
+        candidate_positions = np.flatnonzero(same_account & (group_sizes > 2))
+        ref_groups = df.iloc[candidate_positions].groupby('reference_number', sort=False).indices
+        total_refs = len(ref_groups)
+        print(f"🔄 Processing {total_refs} multi-transaction (3+) reference numbers for reversal detection...")
+        
+        for idx, group_positions in enumerate(ref_groups.values()):
             if idx % 100 == 0 and idx > 0:
                 print(f"   Processed {idx}/{total_refs} reference numbers ({idx/total_refs*100:.1f}%)")
             
-            ref_transactions = df[df['reference_number'] == ref_num]
+            # Row positions of this reference in df; O(group size) instead of a full-frame mask
+            positions = candidate_positions[group_positions]
+            reversal_indices = find_reversal_groups(net_amounts[positions])
             
-            if len(ref_transactions) == 1:
-                # Single transaction - always Unique
-                continue
-            elif ref_transactions['account_number'].nunique() > 1:
-                # Multiple accounts - check for inter-bank transfers
-                if abs(ref_transactions['net_transaction'].sum()) < 0.01:
-                    df.loc[df['reference_number'] == ref_num, 'temp_classification'] = 'Inter-bank'
-            else:
-                # Same account, multiple transactions
-                reversal_indices = find_reversal_groups(ref_transactions)
-                
-                if reversal_indices:
-                    # Mark reversal group transactions
-                    ref_indices = ref_transactions.index[reversal_indices]
-                    df.loc[ref_indices, 'temp_classification'] = 'Reversed'
-                    df.loc[ref_indices, 'temp_reversal_group'] = True
+            if reversal_indices:
+                # Mark reversal group transactions
+                classification[positions[reversal_indices]] = 'Reversed'
         
         # Apply the classification
-        df['transaction_classification'] = df['temp_classification']
-        
-        # Clean up temporary columns
-        df = df.drop(['temp_classification', 'temp_reversal_group'], axis=1)
-        
-        # Drop the helper columns
-        df = df.drop(['net_sum', 'count', 'unique_accounts'], axis=1)
+        df['transaction_classification'] = pd.Categorical(classification)
         
         # Clean up and reorder columns for better readability
         column_order = [
@@ -530,7 +648,7 @@ class AXISStatementProcessor:
         
         # Save to CSV with clean naming
         output_path = self.consolidated_dir / 'consolidated_axis_statements.csv'
-        df.to_csv(output_path, index=False)
+        df.to_csv(output_path, index=False, date_format='%Y-%m-%d')
         
         # Create separate income and expense CSV files
         self.create_separate_income_expense_files(df)
@@ -540,21 +658,22 @@ class AXISStatementProcessor:
         
         # Generate comprehensive summary
         summary_lines = self.generate_comprehensive_summary(df, output_path, verification_results)
+        summary_text = '\n'.join(summary_lines)
         
-        # Print to console
-        for line in summary_lines:
-            print(line)
+        # Print to console (one write instead of one per line)
+        print(summary_text)
         
         # Save summary to text file
         summary_file = self.summary_dir / 'consolidation_summary.txt'
         with open(summary_file, 'w') as f:
-            f.write('\n'.join(summary_lines))
+            f.write(summary_text)
         
         print(f"\n📋 Detailed summary saved to: {summary_file}")
         
-        # Show sample data
-        print(f"\nSample data (first 5 rows):")
-        print(df.head().to_string(index=False))
+        # Show sample data (only useful on an interactive terminal)
+        if sys.stdout.isatty():
+            print(f"\nSample data (first 5 rows):")
+            print(df.head().to_string(index=False))
         
         return output_path
     
@@ -569,7 +688,7 @@ class AXISStatementProcessor:
             # Add amount column (deposit amount for income)
             income_df['amount'] = income_df['deposit_amount']
             income_file = self.income_dir / 'axis_income_transactions.csv'
-            income_df[simplified_columns].to_csv(income_file, index=False)
+            income_df[simplified_columns].to_csv(income_file, index=False, date_format='%Y-%m-%d')
             print(f"📈 Income transactions saved to: {income_file}")
         
         # Create expense file
@@ -578,15 +697,13 @@ class AXISStatementProcessor:
             # Add amount column (withdrawal amount for expenses)
             expense_df['amount'] = expense_df['withdrawal_amount']
             expense_file = self.expense_dir / 'axis_expense_transactions.csv'
-            expense_df[simplified_columns].to_csv(expense_file, index=False)
+            expense_df[simplified_columns].to_csv(expense_file, index=False, date_format='%Y-%m-%d')
             print(f"📉 Expense transactions saved to: {expense_file}")
         
         print(f"✅ Created separate income ({len(income_df)}) and expense ({len(expense_df)}) files")
     
     def generate_comprehensive_summary(self, df, output_path, verification_results=None):
         """Generate comprehensive summary for console and file output"""
-        from datetime import datetime
-        
         lines = []
         lines.append("=" * 80)
         lines.append("AXIS BANK STATEMENT CONSOLIDATION - COMPREHENSIVE SUMMARY")
@@ -598,9 +715,7 @@ class AXISStatementProcessor:
         # Processing Summary
         lines.append("📁 PROCESSING SUMMARY")
         lines.append("-" * 40)
-        csv_files = [f for f in os.listdir(self.statements_dir) 
-                    if f.endswith('.CSV') or f.endswith('.csv')]
-        lines.append(f"Files processed: {len(csv_files)}")
+        lines.append(f"Files processed: {len(self._csv_files)}")
         lines.append(f"Total transactions extracted: {len(df)}")
         lines.append("")
         
@@ -609,13 +724,10 @@ class AXISStatementProcessor:
         lines.append("-" * 40)
         min_date = df['date'].min()
         max_date = df['date'].max()
-        lines.append(f"Period: {min_date} to {max_date}")
+        lines.append(f"Period: {min_date:%Y-%m-%d} to {max_date:%Y-%m-%d}")
         
         # Calculate period duration
-        from datetime import datetime
-        start_date = datetime.strptime(min_date, '%Y-%m-%d')
-        end_date = datetime.strptime(max_date, '%Y-%m-%d')
-        period_days = (end_date - start_date).days
+        period_days = (max_date - min_date).days
         lines.append(f"Duration: {period_days} days ({period_days/30.44:.1f} months)")
         lines.append("")
         
@@ -624,7 +736,7 @@ class AXISStatementProcessor:
         lines.append("-" * 40)
         lines.append(f"Total unique accounts: {df['account_number'].nunique()}")
         
-        account_summary = df.groupby(['account_number', 'account_name']).size().reset_index(name='transaction_count')
+        account_summary = df.groupby(['account_number', 'account_name'], observed=True).size().reset_index(name='transaction_count')
         for _, row in account_summary.iterrows():
             lines.append(f"  {row['account_name']} ({row['account_number']}): {row['transaction_count']} transactions")
         lines.append("")
@@ -632,27 +744,38 @@ class AXISStatementProcessor:
         # Transaction Type Breakdown
         lines.append("💰 TRANSACTION TYPE BREAKDOWN")
         lines.append("-" * 40)
-        type_counts = df['transaction_type'].value_counts()
-        total_income = df[df['transaction_type'] == 'Income']['deposit_amount'].sum()
-        total_expenses = df[df['transaction_type'] == 'Expense']['withdrawal_amount'].sum()
+        
+        # Aggregate once by classification and type; every total below is read
+        # off this small table instead of re-filtering the full frame
+        type_stats = df.groupby(['transaction_classification', 'transaction_type'], observed=True).agg(
+            count=('deposit_amount', 'size'),
+            deposits=('deposit_amount', 'sum'),
+            withdrawals=('withdrawal_amount', 'sum')
+        )
+        type_totals = type_stats.groupby(level='transaction_type', observed=True).sum()
+        type_counts = type_totals['count']
+        total_income = type_totals['deposits'].get('Income', 0)
+        total_expenses = type_totals['withdrawals'].get('Expense', 0)
         
         # External transactions only (for true business performance)
-        external_df = df[df['transaction_classification'] == 'Unique']
-        external_type_counts = external_df['transaction_type'].value_counts()
-        external_income = external_df[external_df['transaction_type'] == 'Income']['deposit_amount'].sum()
-        external_expenses = external_df[external_df['transaction_type'] == 'Expense']['withdrawal_amount'].sum()
+        classifications = type_stats.index.get_level_values('transaction_classification')
+        external_totals = type_stats[classifications == 'Unique'].droplevel('transaction_classification')
+        external_type_counts = external_totals['count']
+        external_income = external_totals['deposits'].get('Income', 0)
+        external_expenses = external_totals['withdrawals'].get('Expense', 0)
+        true_business_profit = external_income - external_expenses
         
         lines.append(f"Total Income transactions: {type_counts.get('Income', 0)} (₹{total_income:,.2f})")
         lines.append(f"Total Expense transactions: {type_counts.get('Expense', 0)} (₹{total_expenses:,.2f})")
         lines.append(f"External Income transactions: {external_type_counts.get('Income', 0)} (₹{external_income:,.2f})")
         lines.append(f"External Expense transactions: {external_type_counts.get('Expense', 0)} (₹{external_expenses:,.2f})")
-        lines.append(f"True business profit/loss: ₹{external_income - external_expenses:,.2f}")
+        lines.append(f"True business profit/loss: ₹{true_business_profit:,.2f}")
         lines.append("")
         
         # Transaction Classification
         lines.append("🔄 TRANSACTION CLASSIFICATION")
         lines.append("-" * 40)
-        classification_counts = df['transaction_classification'].value_counts()
+        classification_counts = type_stats['count'].groupby(level='transaction_classification', observed=True).sum()
         lines.append(f"Unique transactions: {classification_counts.get('Unique', 0)} (external business transactions)")
         lines.append(f"Inter-bank transfers: {classification_counts.get('Inter-bank', 0)} (transfers between accounts)")
         lines.append(f"Reversed transactions: {classification_counts.get('Reversed', 0)} (failed/cancelled payments)")
@@ -665,23 +788,32 @@ class AXISStatementProcessor:
         lines.append("-" * 80)
         
         # Filter out inter-bank transactions for true business performance
-        external_df = df[df['transaction_classification'] == 'Unique']
-        
-        total_external_income = 0
-        total_external_expenses = 0
-        total_external_txns = 0
-        
-        for account_name in df['account_name'].unique():
-            account_data = external_df[external_df['account_name'] == account_name]
-            if len(account_data) > 0:
-                acc_income = account_data[account_data['transaction_type'] == 'Income']['deposit_amount'].sum()
-                acc_expenses = account_data[account_data['transaction_type'] == 'Expense']['withdrawal_amount'].sum()
-                acc_net = acc_income - acc_expenses
-                lines.append(f"{account_name:<15} | {len(account_data):<5} | {acc_income:<15,.2f} | {acc_expenses:<15,.2f} | {acc_net:<15,.2f}")
-                
-                total_external_income += acc_income
-                total_external_expenses += acc_expenses
-                total_external_txns += len(account_data)
+        is_external = df['transaction_classification'].eq('Unique').to_numpy()
+        external_is_income = df['transaction_type'].eq('Income').to_numpy()[is_external]
+        external_is_expense = df['transaction_type'].eq('Expense').to_numpy()[is_external]
+        external_accounts = df['account_name'].to_numpy()[is_external]
+        external_deposits = df['deposit_amount'].to_numpy()[is_external]
+        external_withdrawals = df['withdrawal_amount'].to_numpy()[is_external]
+        
+        # Per-account external totals in one groupby, listed in the order accounts appear
+        account_stats = pd.DataFrame({
+            'account_name': external_accounts,
+            'txns': 1,
+            'income': np.where(external_is_income, external_deposits, 0.0),
+            'expenses': np.where(external_is_expense, external_withdrawals, 0.0),
+            'income_txns': external_is_income,
+            'expense_txns': external_is_expense
+        }).groupby('account_name', sort=False).sum()
+        account_order = [name for name in df['account_name'].unique() if name in account_stats.index]
+        
+        for account_name, acc_txns, acc_income, acc_expenses in account_stats.loc[account_order, ['txns', 'income', 'expenses']].itertuples():
+            acc_net = acc_income - acc_expenses
+            lines.append(f"{account_name:<15} | {acc_txns:<5} | {acc_income:<15,.2f} | {acc_expenses:<15,.2f} | {acc_net:<15,.2f}")
+        
+        # Table totals are column reductions of the per-account stats
+        total_external_txns = int(account_stats['txns'].sum())
+        total_external_income = account_stats['income'].sum()
+        total_external_expenses = account_stats['expenses'].sum()
         
         lines.append("-" * 80)
         lines.append(f"{'TOTAL':<15} | {total_external_txns:<5} | {total_external_income:<15,.2f} | {total_external_expenses:<15,.2f} | {total_external_income - total_external_expenses:<15,.2f}")
@@ -692,32 +824,39 @@ class AXISStatementProcessor:
         lines.append("-" * 40)
         
         # Most active account (all transactions)
-        most_active = df['account_name'].value_counts().index[0]
-        most_active_count = df['account_name'].value_counts().iloc[0]
+        account_counts = df['account_name'].value_counts()
+        most_active = account_counts.index[0]
+        most_active_count = account_counts.iloc[0]
         lines.append(f"Most active account: {most_active} ({most_active_count} transactions)")
         
+        # Highest external income/expense accounts come from the per-account stats above,
+        # restricted to accounts that have that kind of transaction (sorted by account
+        # name so idxmax breaks ties on the alphabetically first account)
+        account_stats = account_stats.sort_index()
+        
         # Highest external income account
-        external_account_income = external_df[external_df['transaction_type'] == 'Income'].groupby('account_name')['deposit_amount'].sum()
+        external_account_income = account_stats.loc[account_stats['income_txns'] > 0, 'income']
         if len(external_account_income) > 0:
             highest_income_account = external_account_income.idxmax()
             highest_income_amount = external_account_income.max()
             lines.append(f"Highest external income account: {highest_income_account} (₹{highest_income_amount:,.2f})")
         
         # Highest external expense account
-        external_account_expenses = external_df[external_df['transaction_type'] == 'Expense'].groupby('account_name')['withdrawal_amount'].sum()
+        external_account_expenses = account_stats.loc[account_stats['expense_txns'] > 0, 'expenses']
         if len(external_account_expenses) > 0:
             highest_expense_account = external_account_expenses.idxmax()
             highest_expense_amount = external_account_expenses.max()
             lines.append(f"Highest external expense account: {highest_expense_account} (₹{highest_expense_amount:,.2f})")
         
         # Inter-bank and reversed transaction insights
-        interbank_amount = df[df['transaction_classification'] == 'Inter-bank']['net_transaction'].abs().sum() / 2
-        reversed_amount = df[df['transaction_classification'] == 'Reversed']['net_transaction'].abs().sum() / 2
+        # Both volumes from one pass over the absolute net amounts, grouped by classification
+        classification_volumes = df['net_transaction'].abs().groupby(df['transaction_classification'], observed=True).sum() / 2
+        interbank_amount = classification_volumes.get('Inter-bank', 0.0)
+        reversed_amount = classification_volumes.get('Reversed', 0.0)
         lines.append(f"Total inter-bank transfer volume: ₹{interbank_amount:,.2f}")
         lines.append(f"Total reversed transaction volume: ₹{reversed_amount:,.2f}")
         
         # True business performance (external only)
-        true_business_profit = external_income - external_expenses
         if true_business_profit > 0:
             lines.append(f"True business profit (external only): ₹{true_business_profit:,.2f}")
         elif true_business_profit < 0:
@@ -787,19 +926,28 @@ class AXISStatementProcessor:
         return lines
     
     def verify_balance_integrity(self, df):
-        """Verify balance integrity by comparing calculated vs actual balances"""
+        """Verify balance integrity by comparing calculated vs actual balances
+        
+        The returned dict's 'balance_tracking' is a DataFrame (date, transaction_type,
+        amount, running_balance), empty when a balance could not be extracted; test it
+        with .empty rather than truthiness.
+        """
         print(f"\n🔍 BALANCE INTEGRITY VERIFICATION")
         print(f"{'='*60}")
         
         # Get the prioritized files to find opening and closing balances
-        csv_files = [f for f in os.listdir(self.statements_dir) 
-                    if f.endswith('.CSV') or f.endswith('.csv')]
+        csv_files = [entry.name for entry in self._csv_files]
         file_analysis = self.analyze_statement_files(csv_files)
         prioritized_files = self.prioritize_files_by_coverage(file_analysis)
         
+        # Scan every source statement up front (on a thread pool); the balance and
+        # transaction count lookups below then read the cached scans
+        self.scan_statements_in_parallel([file_info['file_path'] for file_info in prioritized_files])
+        
         # Find the earliest and latest dates in our consolidated data
-        earliest_date = df['date'].min()
-        latest_date = df['date'].max()
+        # (as YYYY-MM-DD strings, matching the statement periods they are compared with)
+        earliest_date = df['date'].min().strftime('%Y-%m-%d')
+        latest_date = df['date'].max().strftime('%Y-%m-%d')
         
         print(f"Consolidated data period: {earliest_date} to {latest_date}")
         
@@ -856,34 +1004,35 @@ class AXISStatementProcessor:
                 'expected_change': 0,
                 'issues': ['Could not extract opening or closing balance'],
                 'source_files_info': source_files_info,
-                'balance_tracking': []
+                'balance_tracking': pd.DataFrame()
             }
         
         # Calculate cumulative balance from our consolidated transactions
-        # Sort by date to ensure proper chronological order
-        df_sorted = df.sort_values('date')
-        
-        # Start with opening balance
-        cumulative_balance = opening_balance
-        balance_tracking = []
+        # Sort by date to ensure proper chronological order (skipped when the
+        # transactions already are, e.g. a single account's statements)
+        df_sorted = df if df['date'].is_monotonic_increasing else df.sort_values('date')
         
         print(f"\n📈 Balance Calculation:")
-        print(f"Starting balance: ₹{cumulative_balance:,.2f}")
-        
-        # Process each transaction chronologically
-        for _, transaction in df_sorted.iterrows():
-            if transaction['transaction_type'] == 'Income':
-                cumulative_balance += transaction['deposit_amount']
-            elif transaction['transaction_type'] == 'Expense':
-                cumulative_balance -= transaction['withdrawal_amount']
-            
-            # Track balance for verification
-            balance_tracking.append({
-                'date': transaction['date'],
-                'transaction_type': transaction['transaction_type'],
-                'amount': transaction['deposit_amount'] if transaction['transaction_type'] == 'Income' else transaction['withdrawal_amount'],
-                'running_balance': cumulative_balance
-            })
+        print(f"Starting balance: ₹{opening_balance:,.2f}")
+        
+        # The running balance is one cumulative sum over the transactions in date order,
+        # seeded with the opening balance: income adds the deposit, expense subtracts the
+        # withdrawal, and anything else leaves the balance unchanged.
+        is_income = df_sorted['transaction_type'].eq('Income').to_numpy()
+        is_expense = df_sorted['transaction_type'].eq('Expense').to_numpy()
+        deposits = df_sorted['deposit_amount'].to_numpy(dtype=np.float64)
+        withdrawals = df_sorted['withdrawal_amount'].to_numpy(dtype=np.float64)
+        balance_changes = np.where(is_income, deposits, np.where(is_expense, -withdrawals, 0.0))
+        running_balance = np.cumsum(np.concatenate(([opening_balance], balance_changes)))[1:]
+        cumulative_balance = running_balance[-1] if len(running_balance) else opening_balance
+        
+        # Track balance for verification, built column-wise
+        balance_tracking = pd.DataFrame({
+            'date': df_sorted['date'].to_numpy(),
+            'transaction_type': df_sorted['transaction_type'].to_numpy(),
+            'amount': np.where(is_income, deposits, withdrawals),
+            'running_balance': running_balance
+        })
         
         print(f"Final calculated balance: ₹{cumulative_balance:,.2f}")
         print(f"Expected closing balance: ₹{closing_balance:,.2f}")
@@ -906,8 +1055,9 @@ class AXISStatementProcessor:
         print(f"\n📊 DETAILED ANALYSIS:")
         
         # Summary of transactions
-        total_income = df[df['transaction_type'] == 'Income']['deposit_amount'].sum()
-        total_expenses = df[df['transaction_type'] == 'Expense']['withdrawal_amount'].sum()
+        # Masked reductions straight on the arrays; no filtered copies of the frame
+        total_income = np.add.reduce(df['deposit_amount'].to_numpy(), where=df['transaction_type'].eq('Income').to_numpy())
+        total_expenses = np.add.reduce(df['withdrawal_amount'].to_numpy(), where=df['transaction_type'].eq('Expense').to_numpy())
         
         print(f"Total income transactions: ₹{total_income:,.2f}")
         print(f"Total expense transactions: ₹{total_expenses:,.2f}")
@@ -950,92 +1100,48 @@ class AXISStatementProcessor:
             'balance_tracking': balance_tracking
         }
     
+    def scan_statement(self, file_path):
+        """Scan a statement file, reusing the scan from earlier in this run"""
+        cache_key = self._file_cache_key(file_path)
+        if cache_key not in self._scan_cache:
+            self._scan_cache[cache_key] = scan_statement_file(file_path)
+        return self._scan_cache[cache_key]
+    
+    def scan_statements_in_parallel(self, file_paths):
+        """Scan statement files on a small thread pool, returning results in input order"""
+        # Only files not already in the scan cache are read; the scan is light
+        # csv.reader work, so threads overlap the file I/O without a process pool
+        pending = [file_path for file_path in dict.fromkeys(file_paths)
+                   if self._file_cache_key(file_path) not in self._scan_cache]
+        
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(pending), 4)) as executor:
+                for file_path, scan in zip(pending, executor.map(scan_statement_file, pending)):
+                    self._scan_cache[self._file_cache_key(file_path)] = scan
+        
+        return [self.scan_statement(file_path) for file_path in file_paths]
+    
     def extract_opening_balance(self, file_path):
         """Extract opening balance from a statement file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line in lines:
-                if 'OPENING BALANCE' in line:
-                    fields = self.parse_csv_line(line)
-                    if len(fields) >= 7:
-                        balance_str = fields[6].strip()  # Balance is in field 7 (index 6)
-                        balance = self.clean_balance(balance_str)
-                        if balance is not None:
-                            print(f"    Found opening balance: {balance_str} -> ₹{balance:,.2f}")
-                            return balance
-                        else:
-                            print(f"    Could not parse opening balance: {balance_str}")
+        balance = self.scan_statement(file_path).opening_balance
+        if balance is None:
             print(f"    No opening balance found in {os.path.basename(file_path)}")
-            return None
-        except Exception as e:
-            print(f"Error extracting opening balance from {file_path}: {str(e)}")
-            return None
+        else:
+            print(f"    Found opening balance: ₹{balance:,.2f}")
+        return balance
     
     def extract_closing_balance(self, file_path):
         """Extract closing balance from a statement file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line in lines:
-                if 'CLOSING BALANCE' in line:
-                    fields = self.parse_csv_line(line)
-                    if len(fields) >= 7:
-                        balance_str = fields[6].strip()  # Balance is in field 7 (index 6)
-                        balance = self.clean_balance(balance_str)
-                        if balance is not None:
-                            print(f"    Found closing balance: {balance_str} -> ₹{balance:,.2f}")
-                            return balance
-                        else:
-                            print(f"    Could not parse closing balance: {balance_str}")
+        balance = self.scan_statement(file_path).closing_balance
+        if balance is None:
             print(f"    No closing balance found in {os.path.basename(file_path)}")
-            return None
-        except Exception as e:
-            print(f"Error extracting closing balance from {file_path}: {str(e)}")
-            return None
+        else:
+            print(f"    Found closing balance: ₹{balance:,.2f}")
+        return balance
     
     def count_transactions_in_file(self, file_path):
         """Count actual transactions in a source file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Find header row
-            header_row = None
-            for i, line in enumerate(lines):
-                if 'S.No' in line and 'Transaction Date' in line:
-                    header_row = i
-                    break
-            
-            if header_row is None:
-                return 0
-            
-            # Count transaction rows
-            transaction_count = 0
-            for i in range(header_row + 1, len(lines)):
-                line = lines[i].strip()
-                if not line:
-                    continue
-                
-                fields = self.parse_csv_line(line)
-                if len(fields) < 9:
-                    continue
-                
-                # Skip summary rows
-                if 'TRANSACTION TOTAL' in fields[3] or 'CLOSING BALANCE' in fields[3] or 'OPENING BALANCE' in fields[3]:
-                    continue
-                
-                # Check if this is a valid transaction row
-                date_str = fields[1].strip()
-                if date_str and len(date_str) >= 5:
-                    transaction_count += 1
-            
-            return transaction_count
-        except Exception as e:
-            print(f"Error counting transactions in {file_path}: {str(e)}")
-            return 0
+        return self.scan_statement(file_path).transaction_count
     
     def copy_to_desktop(self, output_files):
         """Copy output files to a timestamped directory on the desktop"""
@@ -1050,14 +1156,16 @@ class AXISStatementProcessor:
             # Create the directory
             desktop_dir.mkdir(parents=True, exist_ok=True)
             
+            # Copies are I/O bound, so run them concurrently
+            sources = [Path(file_path) for file_path in output_files if Path(file_path).exists()]
+            destinations = [desktop_dir / source.name for source in sources]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(shutil.copy2, sources, destinations))
+            
             copied_files = []
-            for file_path in output_files:
-                if os.path.exists(file_path):
-                    file_name = os.path.basename(file_path)
-                    destination = desktop_dir / file_name
-                    shutil.copy2(file_path, destination)
-                    copied_files.append(str(destination))
-                    print(f"📋 Copied {file_name} to: {destination}")
+            for destination in destinations:
+                copied_files.append(str(destination))
+                print(f"📋 Copied {destination.name} to: {destination}")
             
             print(f"\n📁 All files copied to desktop directory: {desktop_dir}")
             return str(desktop_dir), copied_files
@@ -1112,19 +1220,18 @@ def main():
         print("Please ensure the directory exists and contains CSV files.")
         return
     
+    processor = AXISStatementProcessor(args.statements_dir, parallel=True)
+    
     # Check if directory has CSV files
-    csv_files = [f for f in os.listdir(args.statements_dir) 
-                if f.endswith('.CSV') or f.endswith('.csv')]
-    if not csv_files:
+    if not processor._csv_files:
         print(f"❌ Error: No CSV files found in: {args.statements_dir}")
         print("Please ensure the directory contains AXIS bank statement CSV files.")
         return
     
     print(f"📂 Using statements directory: {args.statements_dir}")
-    print(f"📊 Found {len(csv_files)} CSV files to process")
+    print(f"📊 Found {len(processor._csv_files)} CSV files to process")
     
     # Process statements
-    processor = AXISStatementProcessor(args.statements_dir)
     output_file = processor.create_consolidated_csv()
     
     if output_file:
@@ -1150,9 +1257,6 @@ def main():
             if os.path.exists(expense_file):
                 output_files.append(expense_file)
             
-            # Add party analysis files if they exist
-            import glob
-            
             # Add party analysis files with clean naming
             party_summary_file = os.path.join(data_dir, "summary", "party_wise_income_summary.txt")
             if os.path.exists(party_summary_file):
@@ -20,20 +20,20 @@ def create_party_list():
     
     print(f"📊 Using party analysis file: {party_file}")
     
-    # Read the enhanced CSV with party names
-    df = pd.read_csv(party_file)
+    # Read only the party and amount columns; party names are few and repeated, so
+    # load them as categories and the filter/groupby below work on integer codes
+    df = pd.read_csv(party_file, usecols=['party_name', 'amount'],
+                     dtype={'party_name': 'category', 'amount': 'float64'})
     
     # Filter out uncategorized transactions
     categorized_df = df[df['party_name'] != 'Uncategorized']
     
-    # Group by party and sum amounts
-    party_summary = categorized_df.groupby('party_name').agg({
-        'amount': ['sum', 'count']
-    }).round(2)
-    
-    # Flatten column names
-    party_summary.columns = ['total_amount', 'transaction_count']
-    party_summary = party_summary.reset_index()
+    # Group by party and sum amounts (named aggregation gives flat column names directly;
+    # observed=True drops the filtered-out Uncategorized category)
+    party_summary = categorized_df.groupby('party_name', as_index=False, observed=True).agg(
+        total_amount=('amount', 'sum'),
+        transaction_count=('amount', 'count')
+    ).round(2)
     
     # Sort by total amount (descending)
     party_summary = party_summary.sort_values('total_amount', ascending=False)
@@ -45,31 +45,35 @@ def create_party_list():
     # Create output file with clean naming
     output_file = "data/summary/party_list_summary.txt"
     
+    lines = [
+        "=" * 80,
+        "AXIS BANK - PARTY LIST SUMMARY",
+        "=" * 80,
+        f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Total categorized amount: ₹{total_categorized:,.2f}",
+        f"Total parties: {len(party_summary)}",
+        "",
+        "🏢 PARTY WISE INCOME SUMMARY",
+        "-" * 80,
+        f"{'Rank':<4} {'Party Name':<40} {'Amount (₹)':<15} {'Count':<8} {'%':<6}",
+        "-" * 80,
+    ]
+    
+    # Rank by position in the sorted summary (the index still holds the pre-sort labels);
+    # party names are truncated to fit the column
+    lines.extend(
+        f"{rank:<4} {party_name[:39]:<40} {f'{total_amount:,.2f}':<15} {int(count):<8} {f'{percentage:.1f}%':<6}"
+        for rank, (party_name, total_amount, count, percentage)
+        in enumerate(party_summary.itertuples(index=False), 1)
+    )
+    
+    lines.append("-" * 80)
+    lines.append(f"{'TOTAL':<44} {total_categorized:>15,.2f} {'100.0%':>14}")
+    lines.append("=" * 80)
+    
+    # Write the whole report in one call
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("AXIS BANK - PARTY LIST SUMMARY\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total categorized amount: ₹{total_categorized:,.2f}\n")
-        f.write(f"Total parties: {len(party_summary)}\n\n")
-        
-        f.write("🏢 PARTY WISE INCOME SUMMARY\n")
-        f.write("-" * 80 + "\n")
-        f.write(f"{'Rank':<4} {'Party Name':<40} {'Amount (₹)':<15} {'Count':<8} {'%':<6}\n")
-        f.write("-" * 80 + "\n")
-        
-        for i, row in party_summary.iterrows():
-            rank = i + 1
-            party_name = row['party_name'][:39]  # Truncate if too long
-            amount = f"{row['total_amount']:,.2f}"
-            count = int(row['transaction_count'])
-            percentage = f"{row['percentage']:.1f}%"
-            
-            f.write(f"{rank:<4} {party_name:<40} {amount:<15} {count:<8} {percentage:<6}\n")
-        
-        f.write("-" * 80 + "\n")
-        f.write(f"{'TOTAL':<44} {total_categorized:>15,.2f} {'100.0%':>14}\n")
-        f.write("=" * 80 + "\n")
+        f.write("\n".join(lines) + "\n")
     
     print(f"📄 Party list summary saved to: {output_file}")
     
@@ -6,9 +6,11 @@ Handles the entire process from statement consolidation to party analysis
 
 import os
 import sys
+import shutil
 import subprocess
 import platform
 from pathlib import Path
+from datetime import datetime
 import time
 
 class AXISWorkflow:
@@ -246,9 +248,6 @@ class AXISWorkflow:
         """Copy all generated files to desktop with organized directory structure"""
         self.print_step(9, "Copying All Files to Desktop")
         
-        import shutil
-        from datetime import datetime
-        
         # Create desktop directory with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         desktop_dir = Path.home() / "Desktop" / f"axis_complete_workflow_{timestamp}"